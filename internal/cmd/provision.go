@@ -137,11 +137,9 @@ func runProvision(cmd *cobra.Command, args []string) error {
 	}
 
 	if provisionDryRun {
-		yamlOutput, err := manifest.RenderToYAML(output)
-		if err != nil {
+		if err := manifest.WriteYAML(os.Stdout, output); err != nil {
 			return fmt.Errorf("render yaml: %w", err)
 		}
-		fmt.Print(yamlOutput)
 		return nil
 	}
 
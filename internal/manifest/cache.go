@@ -0,0 +1,94 @@
+package manifest
+
+import (
+	"os"
+	"sync"
+	"time"
+)
+
+// maxCacheEntries bounds each render cache. A single stack render touches far
+// fewer files than this, so the cache is simply reset when full instead of
+// tracking recency.
+const maxCacheEntries = 256
+
+// boundedCache is a small concurrency-safe string-keyed cache.
+type boundedCache[V any] struct {
+	mu      sync.Mutex
+	entries map[string]V
+}
+
+// get returns the cached value for key, if any.
+func (c *boundedCache[V]) get(key string) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	v, ok := c.entries[key]
+	return v, ok
+}
+
+// getBytes is get for a []byte key. Indexing the map with string(key) directly
+// lets the compiler skip copying the key for the lookup.
+func (c *boundedCache[V]) getBytes(key []byte) (V, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	v, ok := c.entries[string(key)]
+	return v, ok
+}
+
+// put stores value under key, resetting the cache first if it is full.
+func (c *boundedCache[V]) put(key string, value V) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if c.entries == nil || len(c.entries) >= maxCacheEntries {
+		c.entries = make(map[string]V)
+	}
+	c.entries[key] = value
+}
+
+// parsedProvision is the parse result of one interpolated provision file.
+type parsedProvision struct {
+	meta *ManifestMeta
+	raw  map[string]any
+}
+
+// provisionCache memoizes provision parses keyed by their interpolated text.
+// The same provision is loaded for every service (and every include) that
+// references it, and the parse depends only on that text, so identical loads
+// skip YAML parsing. Keying on content means edited files never hit stale entries.
+var provisionCache boundedCache[parsedProvision]
+
+// cachedFile is a file's content together with the stat data it was read under.
+type cachedFile struct {
+	modTime time.Time
+	size    int64
+	data    []byte
+}
+
+// fileCache memoizes manifest reads keyed by path. Entries are validated against
+// the file's modification time and size, so re-rendering unchanged manifests
+// costs a stat per file instead of a read.
+var fileCache boundedCache[cachedFile]
+
+// readFileCached reads path like os.ReadFile, serving unchanged files from
+// fileCache. Errors are returned unwrapped so os.IsNotExist still applies.
+// The returned slice is shared and must not be modified.
+func readFileCached(path string) ([]byte, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return nil, err
+	}
+
+	if cached, ok := fileCache.get(path); ok && cached.modTime.Equal(info.ModTime()) && cached.size == info.Size() {
+		return cached.data, nil
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil, err
+	}
+
+	fileCache.put(path, cachedFile{modTime: info.ModTime(), size: info.Size(), data: data})
+	return data, nil
+}
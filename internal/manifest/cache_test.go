@@ -0,0 +1,72 @@
+package manifest
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestBoundedCache(t *testing.T) {
+	var c boundedCache[int]
+
+	_, ok := c.get("missing")
+	assert.False(t, ok)
+
+	c.put("a", 1)
+	got, ok := c.get("a")
+	assert.True(t, ok)
+	assert.Equal(t, 1, got)
+}
+
+func TestBoundedCache_ResetsWhenFull(t *testing.T) {
+	var c boundedCache[int]
+
+	for i := 0; i < maxCacheEntries; i++ {
+		c.put(fmt.Sprintf("key-%d", i), i)
+	}
+	c.put("overflow", 1)
+
+	assert.Len(t, c.entries, 1)
+	got, ok := c.get("overflow")
+	assert.True(t, ok)
+	assert.Equal(t, 1, got)
+}
+
+func TestReadFileCached(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "provision.yml")
+	require.NoError(t, os.WriteFile(path, []byte("first"), 0644))
+
+	data, err := readFileCached(path)
+	require.NoError(t, err)
+	assert.Equal(t, "first", string(data))
+
+	// Unchanged files are served from the cache
+	cached, ok := fileCache.get(path)
+	require.True(t, ok)
+	assert.Equal(t, "first", string(cached.data))
+
+	// A rewrite with a new size is picked up
+	require.NoError(t, os.WriteFile(path, []byte("second!"), 0644))
+	data, err = readFileCached(path)
+	require.NoError(t, err)
+	assert.Equal(t, "second!", string(data))
+
+	// So is a same-size rewrite with a new modification time
+	require.NoError(t, os.WriteFile(path, []byte("third!!"), 0644))
+	later := time.Now().Add(time.Hour)
+	require.NoError(t, os.Chtimes(path, later, later))
+	data, err = readFileCached(path)
+	require.NoError(t, err)
+	assert.Equal(t, "third!!", string(data))
+}
+
+func TestReadFileCached_NotExist(t *testing.T) {
+	_, err := readFileCached(filepath.Join(t.TempDir(), "missing.yml"))
+	require.Error(t, err)
+	assert.True(t, os.IsNotExist(err))
+}
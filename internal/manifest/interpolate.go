@@ -1,38 +1,93 @@
 package manifest
 
 import (
+	"bytes"
 	"fmt"
-	"regexp"
 	"strings"
 )
 
-// varPattern matches ${varname} placeholders.
-var varPattern = regexp.MustCompile(`\$\{(\w+)\}`)
-
 // Interpolate replaces ${var} placeholders with values from the variables map.
 // Returns an error if any referenced variable is missing.
 // This function operates on raw strings BEFORE YAML parsing.
 func Interpolate(template string, variables map[string]any) (string, error) {
+	// Most strings (static provisions, sidecar defaults like "17") hold no
+	// placeholders; a substring check is far cheaper than a full scan.
+	if !strings.Contains(template, "${") {
+		return template, nil
+	}
+
+	result, missingVars := expandVars(make([]byte, 0, len(template)), template, variables)
+	if len(missingVars) > 0 {
+		return "", missingVariablesError(missingVars)
+	}
+
+	return string(result), nil
+}
+
+// interpolateBytes is Interpolate for raw file content. It substitutes directly
+// on the bytes read from disk, so loading a provision never converts the file
+// to a string and back before parsing. Content without placeholders is
+// returned as-is.
+func interpolateBytes(template []byte, variables map[string]any) ([]byte, error) {
+	if !bytes.Contains(template, []byte("${")) {
+		return template, nil
+	}
+
+	result, missingVars := expandVars(make([]byte, 0, len(template)), template, variables)
+	if len(missingVars) > 0 {
+		return nil, missingVariablesError(missingVars)
+	}
+
+	return result, nil
+}
+
+// expandVars appends template to dst with every ${name} placeholder (name made
+// of ASCII letters, digits and underscores) replaced by its value, and returns
+// the names that had no value. Missing placeholders are kept verbatim. It is a
+// single hand-written pass over the input, so substitution needs neither the
+// regexp engine nor a callback per placeholder.
+func expandVars[T string | []byte](dst []byte, template T, variables map[string]any) ([]byte, []string) {
 	var missingVars []string
+	last := 0
 
-	result := varPattern.ReplaceAllStringFunc(template, func(match string) string {
-		// Extract variable name from ${varname}
-		key := varPattern.FindStringSubmatch(match)[1]
+	for i := 0; i+1 < len(template); i++ {
+		if template[i] != '$' || template[i+1] != '{' {
+			continue
+		}
 
+		end := i + 2
+		for end < len(template) && isVarNameByte(template[end]) {
+			end++
+		}
+		if end == i+2 || end == len(template) || template[end] != '}' {
+			continue
+		}
+
+		key := string(template[i+2 : end])
 		value, ok := variables[key]
 		if !ok {
 			missingVars = append(missingVars, key)
-			return match // Keep original if missing
+			i = end
+			continue
 		}
 
-		return toString(value)
-	})
-
-	if len(missingVars) > 0 {
-		return "", fmt.Errorf("missing variables: ${%s}", strings.Join(missingVars, "}, ${"))
+		dst = append(dst, template[last:i]...)
+		dst = append(dst, toString(value)...)
+		last = end + 1
+		i = end
 	}
 
-	return result, nil
+	return append(dst, template[last:]...), missingVars
+}
+
+// isVarNameByte reports whether c may appear in a placeholder name (\w).
+func isVarNameByte(c byte) bool {
+	return c == '_' || ('a' <= c && c <= 'z') || ('A' <= c && c <= 'Z') || ('0' <= c && c <= '9')
+}
+
+// missingVariablesError reports every placeholder that had no value.
+func missingVariablesError(missingVars []string) error {
+	return fmt.Errorf("missing variables: ${%s}", strings.Join(missingVars, "}, ${"))
 }
 
 // toString converts any value to its string representation.
@@ -1,6 +1,7 @@
 package manifest
 
 import (
+	"regexp"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -51,6 +52,13 @@ func TestInterpolate(t *testing.T) {
 			want:      "No variables here",
 			wantErr:   false,
 		},
+		{
+			name:      "dollar and braces without placeholder returns unchanged",
+			template:  "cost: $5 {not-a-var} $name",
+			variables: map[string]any{},
+			want:      "cost: $5 {not-a-var} $name",
+			wantErr:   false,
+		},
 		{
 			name:     "nested braces do not break",
 			template: "${outer} with ${inner} and extra ${outer}",
@@ -300,3 +308,68 @@ func TestInterpolateValue_NonStringNonMapNonList(t *testing.T) {
 	assert.Equal(t, true, result["bool"])
 	assert.Nil(t, result["nil"])
 }
+
+func TestInterpolateBytes(t *testing.T) {
+	variables := map[string]any{
+		"name": "myapp",
+		"port": 8080,
+	}
+
+	got, err := interpolateBytes([]byte("${name}:\n  port: ${port}\n"), variables)
+	require.NoError(t, err)
+	assert.Equal(t, "myapp:\n  port: 8080\n", string(got))
+
+	// Content without placeholders is returned without copying
+	static := []byte("image: nginx:latest\n")
+	got, err = interpolateBytes(static, variables)
+	require.NoError(t, err)
+	assert.Same(t, &static[0], &got[0])
+
+	// Missing variables are reported the same way as Interpolate
+	_, err = interpolateBytes([]byte("${name} ${missing}"), variables)
+	require.Error(t, err)
+	assert.Equal(t, "missing variables: ${missing}", err.Error())
+}
+
+func TestExpandVars_MatchesRegexp(t *testing.T) {
+	// expandVars replaced a regexp; it must substitute exactly what it matched
+	pattern := regexp.MustCompile(`\$\{(\w+)\}`)
+	variables := map[string]any{"a": "X", "a_1": 7, "nested": "${a}"}
+
+	inputs := []string{
+		"${a}",
+		"${a}${a_1}",
+		"${${a}}",
+		"$${a}}",
+		"${}",
+		"${a",
+		"${a-b}",
+		"${ a }",
+		"${missing} and ${a}",
+		"${nested}",
+		"trailing $",
+		"${a_1}${",
+	}
+
+	for _, input := range inputs {
+		t.Run(input, func(t *testing.T) {
+			var wantMissing []string
+			want := pattern.ReplaceAllStringFunc(input, func(match string) string {
+				key := match[2 : len(match)-1]
+				value, ok := variables[key]
+				if !ok {
+					wantMissing = append(wantMissing, key)
+					return match
+				}
+				return toString(value)
+			})
+
+			got, gotMissing := expandVars(nil, input, variables)
+			assert.Equal(t, want, string(got))
+			assert.Equal(t, wantMissing, gotMissing)
+
+			gotBytes, _ := expandVars(nil, []byte(input), variables)
+			assert.Equal(t, want, string(gotBytes))
+		})
+	}
+}
@@ -6,8 +6,8 @@ import (
 	"strings"
 )
 
-// MaxMergeDepth is the maximum recursion depth for DeepMerge operations.
-// This prevents stack overflow from deeply nested or circular structures.
+// MaxMergeDepth is the maximum nesting depth for DeepMerge operations.
+// This prevents runaway merges of deeply nested or circular structures.
 const MaxMergeDepth = 100
 
 // ErrMergeDepthExceeded indicates the merge operation exceeded the maximum depth.
@@ -31,80 +31,130 @@ var ExtendKeys = map[string]bool{
 //   - Default: replace lists, recursive merge for dicts
 //   - environment/labels are normalized from list to map before merging
 //
-// Panics if recursion depth exceeds MaxMergeDepth to prevent OOM.
+// Neither base nor overlay is modified. Panics if nesting depth exceeds
+// MaxMergeDepth to prevent OOM.
 func DeepMerge(base, overlay map[string]any) map[string]any {
-	return deepMergeInternal(base, overlay, "", 0)
+	result, _ := deepCopy(base).(map[string]any)
+	return deepMergeInto(result, overlay)
 }
 
-func deepMergeInternal(base, overlay map[string]any, path string, depth int) map[string]any {
-	if depth > MaxMergeDepth {
-		panic(fmt.Sprintf("DeepMerge: %v at path %q", ErrMergeDepthExceeded, path))
+// mergeFrame is one pending map-into-map merge in deepMergeInto's work list.
+type mergeFrame struct {
+	dst     map[string]any
+	overlay map[string]any
+	path    string
+	depth   int
+}
+
+// deepMergeInto merges overlay into dst in place and returns dst, allocating it
+// if nil. Only values copied in from overlay are duplicated, so accumulating
+// many provisions into one map costs O(total size) instead of re-copying the
+// accumulator on every merge. dst must not share nested maps or slices with
+// anything the caller still needs unchanged.
+//
+// Nested maps are merged from an explicit work list rather than by recursion,
+// and the dotted path used in the depth panic is only built when descending.
+func deepMergeInto(dst, overlay map[string]any) map[string]any {
+	if dst == nil {
+		dst = make(map[string]any, len(overlay))
 	}
 
-	result := copyMap(base)
+	stack := []mergeFrame{{dst: dst, overlay: overlay}}
+	for len(stack) > 0 {
+		frame := stack[len(stack)-1]
+		stack = stack[:len(stack)-1]
 
-	for key, overlayValue := range overlay {
-		currentPath := key
-		if path != "" {
-			currentPath = path + "." + key
+		if frame.depth > MaxMergeDepth {
+			panic(fmt.Sprintf("DeepMerge: %v at path %q", ErrMergeDepthExceeded, frame.path))
 		}
 
-		baseValue, exists := result[key]
-		if !exists {
-			result[key] = deepCopyWithDepth(overlayValue, depth+1)
-			continue
-		}
+		result := frame.dst
+		for key, overlayValue := range frame.overlay {
+			baseValue, exists := result[key]
+			if !exists {
+				result[key] = deepCopyWithDepth(overlayValue, frame.depth+1)
+				continue
+			}
 
-		// Both are maps - recursive merge
-		baseMap, baseIsMap := baseValue.(map[string]any)
-		overlayMap, overlayIsMap := overlayValue.(map[string]any)
-		if baseIsMap && overlayIsMap {
-			// Normalize environment/labels before dict merge
-			if key == "environment" || key == "labels" {
-				baseMap = normalizeToDict(baseMap, key)
-				overlayMap = normalizeToDict(overlayMap, key)
+			// Both are maps - queue a nested merge into the existing map
+			baseMap, baseIsMap := baseValue.(map[string]any)
+			overlayMap, overlayIsMap := overlayValue.(map[string]any)
+			if baseIsMap && overlayIsMap {
+				// Normalize environment/labels before dict merge
+				if key == "environment" || key == "labels" {
+					baseMap = normalizeToDict(baseMap, key)
+					overlayMap = normalizeToDict(overlayMap, key)
+				}
+				if baseMap == nil {
+					baseMap = make(map[string]any, len(overlayMap))
+				}
+				result[key] = baseMap
+
+				path := key
+				if frame.path != "" {
+					path = frame.path + "." + key
+				}
+				stack = append(stack, mergeFrame{dst: baseMap, overlay: overlayMap, path: path, depth: frame.depth + 1})
+				continue
 			}
-			result[key] = deepMergeInternal(baseMap, overlayMap, currentPath, depth+1)
-			continue
-		}
 
-		// Both are lists - apply merge strategy
-		baseList, baseIsList := toStringSlice(baseValue)
-		overlayList, overlayIsList := toStringSlice(overlayValue)
-		if baseIsList && overlayIsList {
-			if UnionKeys[key] {
-				// Set union - no duplicates
-				result[key] = stringSliceUnion(baseList, overlayList)
-			} else if ExtendKeys[key] {
-				// Extend - append
-				result[key] = append(baseList, overlayList...)
-			} else {
-				// Replace
-				result[key] = deepCopyWithDepth(overlayValue, depth+1)
+			// Both are lists - apply merge strategy
+			baseList, baseIsList := toStringSlice(baseValue)
+			overlayList, overlayIsList := toStringSlice(overlayValue)
+			if baseIsList && overlayIsList {
+				if UnionKeys[key] {
+					// Set union - no duplicates
+					result[key] = stringSliceUnion(baseList, overlayList)
+				} else if ExtendKeys[key] {
+					// Extend - append
+					result[key] = append(baseList, overlayList...)
+				} else {
+					// Replace
+					result[key] = deepCopyWithDepth(overlayValue, frame.depth+1)
+				}
+				continue
 			}
-			continue
-		}
 
-		// Default: replace
-		result[key] = deepCopyWithDepth(overlayValue, depth+1)
+			// Default: replace
+			result[key] = deepCopyWithDepth(overlayValue, frame.depth+1)
+		}
 	}
 
-	return result
+	return dst
+}
+
+// mergeOwned merges overlay into the render accumulator dst. While dst is still
+// empty the overlay is adopted as-is rather than copied key by key, so a target
+// fed by a single provision costs nothing beyond its parse. Both maps must be
+// owned by the caller: freshly loaded or rendered, and not shared elsewhere.
+func mergeOwned(dst, overlay map[string]any) map[string]any {
+	if overlay == nil {
+		return dst
+	}
+	if len(dst) == 0 {
+		return overlay
+	}
+	return deepMergeInto(dst, overlay)
 }
 
 // normalizeToDict converts list-style environment/labels to dict format.
 // Input: ["FOO=bar", "BAZ=qux"] -> {"FOO": "bar", "BAZ": "qux"}
-// Input: {"FOO": "bar"} -> {"FOO": "bar"} (unchanged)
+// Input: {"FOO": "bar"} -> {"FOO": "bar"} (same map, unchanged)
+// Input: {"PORT": 8080} -> {"PORT": "8080"}
 func normalizeToDict(value any, keyName string) map[string]any {
 	if value == nil {
 		return make(map[string]any)
 	}
 
-	// Already a map
+	// Already a map. YAML maps usually hold only string values, in which case
+	// the map is returned as-is instead of being rebuilt identically.
 	if m, ok := value.(map[string]any); ok {
+		if m != nil && hasOnlyStringValues(m) {
+			return m
+		}
 		result := make(map[string]any, len(m))
 		for k, v := range m {
-			result[fmt.Sprintf("%v", k)] = fmt.Sprintf("%v", v)
+			result[k] = toString(v)
 		}
 		return result
 	}
@@ -114,15 +164,14 @@ func normalizeToDict(value any, keyName string) map[string]any {
 	switch v := value.(type) {
 	case []any:
 		for _, item := range v {
-			s := fmt.Sprintf("%v", item)
-			if idx := strings.Index(s, "="); idx > 0 {
-				result[s[:idx]] = s[idx+1:]
+			if k, val, found := strings.Cut(toString(item), "="); found && k != "" {
+				result[k] = val
 			}
 		}
 	case []string:
 		for _, item := range v {
-			if idx := strings.Index(item, "="); idx > 0 {
-				result[item[:idx]] = item[idx+1:]
+			if k, val, found := strings.Cut(item, "="); found && k != "" {
+				result[k] = val
 			}
 		}
 	}
@@ -130,6 +179,16 @@ func normalizeToDict(value any, keyName string) map[string]any {
 	return result
 }
 
+// hasOnlyStringValues reports whether every value in m is a string.
+func hasOnlyStringValues(m map[string]any) bool {
+	for _, v := range m {
+		if _, ok := v.(string); !ok {
+			return false
+		}
+	}
+	return true
+}
+
 // toStringSlice attempts to convert a value to []string.
 // Returns the slice and true if successful, nil and false otherwise.
 func toStringSlice(value any) ([]string, bool) {
@@ -147,21 +206,18 @@ func toStringSlice(value any) ([]string, bool) {
 	}
 }
 
-// stringSliceUnion returns the union of two string slices (no duplicates).
+// stringSliceUnion returns the union of two string slices (no duplicates),
+// keeping first-seen order so rendered output is stable across runs.
 func stringSliceUnion(a, b []string) []any {
-	seen := make(map[string]bool, len(a)+len(b))
+	seen := make(map[string]struct{}, len(a)+len(b))
 	result := make([]any, 0, len(a)+len(b))
 
-	for _, s := range a {
-		if !seen[s] {
-			seen[s] = true
-			result = append(result, s)
-		}
-	}
-	for _, s := range b {
-		if !seen[s] {
-			seen[s] = true
-			result = append(result, s)
+	for _, list := range [2][]string{a, b} {
+		for _, s := range list {
+			if _, ok := seen[s]; !ok {
+				seen[s] = struct{}{}
+				result = append(result, s)
+			}
 		}
 	}
 
@@ -186,29 +242,33 @@ func deepCopy(value any) any {
 }
 
 // deepCopyWithDepth creates a deep copy with depth tracking.
+// Only the container types YAML decodes to are copied; everything else
+// (strings, numbers, bools, nil) is immutable and shared as-is, so leaves
+// never pay for the depth check or a recursive call.
 func deepCopyWithDepth(value any, depth int) any {
-	if value == nil {
-		return nil
-	}
-
-	if depth > MaxMergeDepth {
-		panic(fmt.Sprintf("deepCopy: %v", ErrMergeDepthExceeded))
-	}
-
 	switch v := value.(type) {
 	case map[string]any:
+		checkCopyDepth(depth)
 		result := make(map[string]any, len(v))
 		for k, val := range v {
-			result[k] = deepCopyWithDepth(val, depth+1)
+			if isContainer(val) {
+				val = deepCopyWithDepth(val, depth+1)
+			}
+			result[k] = val
 		}
 		return result
 	case []any:
+		checkCopyDepth(depth)
 		result := make([]any, len(v))
 		for i, val := range v {
-			result[i] = deepCopyWithDepth(val, depth+1)
+			if isContainer(val) {
+				val = deepCopyWithDepth(val, depth+1)
+			}
+			result[i] = val
 		}
 		return result
 	case []string:
+		checkCopyDepth(depth)
 		result := make([]string, len(v))
 		copy(result, v)
 		return result
@@ -217,3 +277,20 @@ func deepCopyWithDepth(value any, depth int) any {
 		return value
 	}
 }
+
+// checkCopyDepth panics once a copy nests deeper than MaxMergeDepth.
+func checkCopyDepth(depth int) {
+	if depth > MaxMergeDepth {
+		panic(fmt.Sprintf("deepCopy: %v", ErrMergeDepthExceeded))
+	}
+}
+
+// isContainer reports whether value is one of the mutable types deepCopy duplicates.
+func isContainer(value any) bool {
+	switch value.(type) {
+	case map[string]any, []any, []string:
+		return true
+	default:
+		return false
+	}
+}
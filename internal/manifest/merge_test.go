@@ -1,6 +1,7 @@
 package manifest
 
 import (
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -203,6 +204,26 @@ func TestNormalizeToDict(t *testing.T) {
 				"FOO": "bar",
 			},
 		},
+		{
+			name: "map values stringified",
+			input: map[string]any{
+				"PORT":  8080,
+				"DEBUG": true,
+				"NAME":  "app",
+			},
+			keyName: "environment",
+			want: map[string]any{
+				"PORT":  "8080",
+				"DEBUG": "true",
+				"NAME":  "app",
+			},
+		},
+		{
+			name:    "nil map",
+			input:   map[string]any(nil),
+			keyName: "labels",
+			want:    map[string]any{},
+		},
 		{
 			name:    "nil input",
 			input:   nil,
@@ -241,6 +262,16 @@ func TestNormalizeToDict(t *testing.T) {
 	}
 }
 
+func TestNormalizeToDict_StringMapReused(t *testing.T) {
+	input := map[string]any{"FOO": "bar"}
+
+	got := normalizeToDict(input, "environment")
+	got["BAZ"] = "qux"
+
+	// An all-string map is returned as-is rather than rebuilt
+	assert.Equal(t, "qux", input["BAZ"])
+}
+
 func TestDeepCopy(t *testing.T) {
 	t.Run("no mutation of original map", func(t *testing.T) {
 		original := map[string]any{
@@ -423,6 +454,81 @@ func TestDeepMerge_NoMutationOfOriginals(t *testing.T) {
 	assert.Equal(t, originalBaseNested, base["nested"].(map[string]any)["inner"])
 }
 
+func TestDeepMergeInto_MergesInPlace(t *testing.T) {
+	dst := map[string]any{
+		"nested": map[string]any{
+			"inner": "base_inner",
+		},
+	}
+	overlay := map[string]any{
+		"nested": map[string]any{
+			"added": map[string]any{"deep": "overlay_deep"},
+		},
+		"list": []any{"a"},
+	}
+
+	got := deepMergeInto(dst, overlay)
+
+	// The accumulator itself is updated rather than copied
+	assert.Equal(t, "base_inner", dst["nested"].(map[string]any)["inner"])
+	assert.Equal(t, "overlay_deep", dst["nested"].(map[string]any)["added"].(map[string]any)["deep"])
+	assert.Equal(t, []any{"a"}, dst["list"])
+	got["marker"] = true
+	assert.Equal(t, true, dst["marker"])
+
+	// Values taken from the overlay are copies, not shared references
+	dst["nested"].(map[string]any)["added"].(map[string]any)["deep"] = "modified"
+	dst["list"].([]any)[0] = "modified"
+	assert.Equal(t, "overlay_deep", overlay["nested"].(map[string]any)["added"].(map[string]any)["deep"])
+	assert.Equal(t, "a", overlay["list"].([]any)[0])
+}
+
+func TestDeepMergeInto_NilDestination(t *testing.T) {
+	got := deepMergeInto(nil, map[string]any{"key": "value"})
+	assert.Equal(t, map[string]any{"key": "value"}, got)
+}
+
+func TestDeepMerge_DepthLimit(t *testing.T) {
+	nested := func(depth int) map[string]any {
+		root := map[string]any{}
+		current := root
+		for i := 0; i < depth; i++ {
+			next := map[string]any{}
+			current["level"] = next
+			current = next
+		}
+		return root
+	}
+
+	assert.NotPanics(t, func() {
+		DeepMerge(nested(MaxMergeDepth), nested(MaxMergeDepth))
+	})
+	assert.PanicsWithValue(t,
+		"DeepMerge: merge depth exceeded maximum at path \""+strings.TrimSuffix(strings.Repeat("level.", MaxMergeDepth+1), ".")+"\"",
+		func() {
+			deepMergeInto(nested(MaxMergeDepth+2), nested(MaxMergeDepth+2))
+		})
+}
+
+func TestMergeOwned(t *testing.T) {
+	first := map[string]any{"services": map[string]any{"app": map[string]any{"image": "app:1"}}}
+	second := map[string]any{"services": map[string]any{"app": map[string]any{"restart": "always"}}}
+
+	// An empty accumulator adopts the first overlay without copying it
+	acc := mergeOwned(map[string]any{}, first)
+	acc["marker"] = true
+	assert.Equal(t, true, first["marker"])
+
+	// Later overlays are merged into it in place
+	acc = mergeOwned(acc, second)
+	app := acc["services"].(map[string]any)["app"].(map[string]any)
+	assert.Equal(t, "app:1", app["image"])
+	assert.Equal(t, "always", app["restart"])
+
+	// A nil overlay leaves the accumulator untouched
+	assert.Equal(t, acc, mergeOwned(acc, nil))
+}
+
 func TestDeepCopy_StringSlice(t *testing.T) {
 	original := []string{"a", "b", "c"}
 
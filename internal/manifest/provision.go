@@ -5,8 +5,6 @@ import (
 	"log"
 	"os"
 	"path/filepath"
-
-	"gopkg.in/yaml.v3"
 )
 
 // LoadProvision loads a provision file, interpolates variables, and parses YAML.
@@ -24,7 +22,7 @@ func loadProvisionInternal(provisionName string, variables map[string]any, provi
 	loaded[provisionName] = true
 
 	provisionPath := filepath.Join(provisionsDir, provisionName+".yml")
-	rawContent, err := os.ReadFile(provisionPath)
+	rawContent, err := readFileCached(provisionPath)
 	if err != nil {
 		if os.IsNotExist(err) {
 			return nil, fmt.Errorf("provision not found: %s", provisionPath)
@@ -32,10 +30,16 @@ func loadProvisionInternal(provisionName string, variables map[string]any, provi
 		return nil, fmt.Errorf("read provision %s: %w", provisionPath, err)
 	}
 
-	// Validate apiVersion if present (soft validation for backwards compatibility)
-	meta, err := ValidateManifest(rawContent)
+	// Interpolate BEFORE YAML parsing. Static files with no placeholders skip
+	// the substitution pass entirely and are parsed as read.
+	content, err := interpolateBytes(rawContent, variables)
+	if err != nil {
+		return nil, fmt.Errorf("interpolate provision %s: %w", provisionName, err)
+	}
+
+	meta, rawProvision, err := parseProvision(provisionName, content)
 	if err != nil {
-		return nil, fmt.Errorf("validate provision %s: %w", provisionName, err)
+		return nil, err
 	}
 
 	// Warn if manifest is unversioned
@@ -45,22 +49,6 @@ func loadProvisionInternal(provisionName string, variables map[string]any, provi
 		log.Printf("Warning: provision %s has kind %s, expected %s", provisionName, meta.Kind, KindProvision)
 	}
 
-	// Interpolate BEFORE YAML parsing
-	interpolated, err := Interpolate(string(rawContent), variables)
-	if err != nil {
-		return nil, fmt.Errorf("interpolate provision %s: %w", provisionName, err)
-	}
-
-	// Parse YAML into raw map to handle includes
-	var rawProvision map[string]any
-	if err := yaml.Unmarshal([]byte(interpolated), &rawProvision); err != nil {
-		return nil, fmt.Errorf("parse provision %s: %w", provisionName, err)
-	}
-
-	if rawProvision == nil {
-		rawProvision = make(map[string]any)
-	}
-
 	// Remove apiVersion and kind from raw provision (they're metadata, not output)
 	delete(rawProvision, "apiVersion")
 	delete(rawProvision, "kind")
@@ -79,58 +67,82 @@ func loadProvisionInternal(provisionName string, variables map[string]any, provi
 		}
 	}
 
+	// Pick this provision's targets out in a single pass over its keys
+	provision := provisionFromRaw(rawProvision)
+
+	// No includes - return provision directly
+	if len(includes) == 0 {
+		return provision, nil
+	}
+
 	// Handle inheritance - load included provisions first, then merge this on top
-	if len(includes) > 0 {
-		result := make(map[string]map[string]any)
-		for _, target := range TargetNames {
-			result[target] = make(map[string]any)
+	result := NewRenderOutput()
+	for _, included := range includes {
+		includedProvision, err := loadProvisionInternal(included, variables, provisionsDir, loaded)
+		if err != nil {
+			return nil, fmt.Errorf("include %s in %s: %w", included, provisionName, err)
 		}
+		mergeProvision(result, includedProvision)
+	}
+	mergeProvision(result, provision)
 
-		for _, included := range includes {
-			includedProvision, err := loadProvisionInternal(included, variables, provisionsDir, loaded)
-			if err != nil {
-				return nil, fmt.Errorf("include %s in %s: %w", included, provisionName, err)
-			}
+	return &Provision{
+		Compose: result.Compose,
+		Traefik: result.Traefik,
+		Gatus:   result.Gatus,
+	}, nil
+}
 
-			// Merge included provision's targets
-			if includedProvision.Compose != nil {
-				result["compose"] = DeepMerge(result["compose"], includedProvision.Compose)
-			}
-			if includedProvision.Traefik != nil {
-				result["traefik"] = DeepMerge(result["traefik"], includedProvision.Traefik)
-			}
-			if includedProvision.Gatus != nil {
-				result["gatus"] = DeepMerge(result["gatus"], includedProvision.Gatus)
-			}
+// provisionFromRaw extracts the compose/traefik/gatus targets from a parsed
+// provision map, ignoring any other keys.
+func provisionFromRaw(rawProvision map[string]any) *Provision {
+	provision := &Provision{}
+	for target, value := range rawProvision {
+		targetData, ok := value.(map[string]any)
+		if !ok {
+			continue
 		}
-
-		// Merge this provision on top of included ones
-		for _, target := range TargetNames {
-			if targetData, ok := rawProvision[target].(map[string]any); ok {
-				result[target] = DeepMerge(result[target], targetData)
-			}
+		switch target {
+		case "compose":
+			provision.Compose = targetData
+		case "traefik":
+			provision.Traefik = targetData
+		case "gatus":
+			provision.Gatus = targetData
 		}
+	}
+	return provision
+}
 
-		return &Provision{
-			Compose: result["compose"],
-			Traefik: result["traefik"],
-			Gatus:   result["gatus"],
-		}, nil
+// parseProvision parses interpolated provision content into a raw map, reusing
+// a cached parse when the same content was seen before. The returned map is
+// always a fresh copy the caller may modify.
+func parseProvision(provisionName string, interpolated []byte) (*ManifestMeta, map[string]any, error) {
+	if cached, ok := provisionCache.getBytes(interpolated); ok {
+		rawProvision, _ := deepCopy(cached.raw).(map[string]any)
+		return cached.meta, rawProvision, nil
 	}
 
-	// No includes - return provision directly
-	provision := &Provision{}
-	if compose, ok := rawProvision["compose"].(map[string]any); ok {
-		provision.Compose = compose
+	// Parse once and validate apiVersion if present (soft validation for backwards compatibility)
+	doc, meta, err := parseManifest(interpolated)
+	if err != nil {
+		return nil, nil, fmt.Errorf("validate provision %s: %w", provisionName, err)
 	}
-	if traefik, ok := rawProvision["traefik"].(map[string]any); ok {
-		provision.Traefik = traefik
+
+	// Decode the parsed document into a raw map to handle includes
+	var rawProvision map[string]any
+	if err := doc.Decode(&rawProvision); err != nil {
+		return nil, nil, fmt.Errorf("parse provision %s: %w", provisionName, err)
 	}
-	if gatus, ok := rawProvision["gatus"].(map[string]any); ok {
-		provision.Gatus = gatus
+
+	if rawProvision == nil {
+		rawProvision = make(map[string]any)
 	}
 
-	return provision, nil
+	cachedRaw, _ := deepCopy(rawProvision).(map[string]any)
+	provisionCache.put(string(interpolated), parsedProvision{meta: meta, raw: cachedRaw})
+
+	return meta, rawProvision, nil
 }
 
 // ListProvisions returns the names of all available provisions.
@@ -402,3 +402,29 @@ gatus:
 	require.NotNil(t, provision.Traefik)
 	require.NotNil(t, provision.Gatus)
 }
+
+func TestLoadProvision_CachedParseIsNotShared(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	content := `compose:
+  services:
+    ${name}:
+      image: test:latest
+`
+	require.NoError(t, writeTestFile(tmpDir, "cached.yml", content))
+
+	first, err := LoadProvision("cached", map[string]any{"name": "app"}, tmpDir)
+	require.NoError(t, err)
+
+	// Mutating one result must not leak into later loads served from the cache
+	first.Compose["services"].(map[string]any)["app"].(map[string]any)["image"] = "modified"
+
+	second, err := LoadProvision("cached", map[string]any{"name": "app"}, tmpDir)
+	require.NoError(t, err)
+	assert.Equal(t, "test:latest", second.Compose["services"].(map[string]any)["app"].(map[string]any)["image"])
+
+	// Different variables produce different content and a separate parse
+	other, err := LoadProvision("cached", map[string]any{"name": "other"}, tmpDir)
+	require.NoError(t, err)
+	assert.Contains(t, other.Compose["services"], "other")
+}
@@ -1,12 +1,17 @@
 package manifest
 
 import (
+	"bufio"
 	"errors"
 	"fmt"
+	"io"
 	"log"
 	"os"
 	"path/filepath"
+	"runtime"
+	"sort"
 	"strings"
+	"sync"
 
 	"gopkg.in/yaml.v3"
 )
@@ -46,7 +51,7 @@ func RenderService(manifest *ServiceManifest, provisionsDir string) (*RenderOutp
 	output := NewRenderOutput()
 
 	// Build variables from config + name
-	variables := make(map[string]any)
+	variables := make(map[string]any, len(manifest.Config)+1)
 	for k, v := range manifest.Config {
 		variables[k] = v
 	}
@@ -80,8 +85,9 @@ func RenderService(manifest *ServiceManifest, provisionsDir string) (*RenderOutp
 			continue
 		}
 
-		// Build sidecar variables: defaults + config + overrides
-		sidecarVars := make(map[string]any)
+		// Build sidecar variables: defaults + config + overrides, sized up front
+		// so the map never grows while the layers are copied in
+		sidecarVars := make(map[string]any, len(defaults)+len(manifest.Config)+2)
 		sidecarVars["name"] = manifest.Name
 		sidecarVars["sidecar"] = need
 
@@ -112,9 +118,18 @@ func RenderService(manifest *ServiceManifest, provisionsDir string) (*RenderOutp
 		mergeProvision(output, provision)
 	}
 
-	// Handle sidecar services with explicit config
-	for sidecarType, sidecarConfig := range manifest.Services {
-		sidecarVars := make(map[string]any)
+	// Handle sidecar services with explicit config. Map iteration order is
+	// random, so walk sidecars by name to keep union-merged lists (networks,
+	// depends_on) in the same order on every render.
+	sidecarTypes := make([]string, 0, len(manifest.Services))
+	for sidecarType := range manifest.Services {
+		sidecarTypes = append(sidecarTypes, sidecarType)
+	}
+	sort.Strings(sidecarTypes)
+
+	for _, sidecarType := range sidecarTypes {
+		sidecarConfig := manifest.Services[sidecarType]
+		sidecarVars := make(map[string]any, len(sidecarConfig)+len(manifest.Config)+2)
 		sidecarVars["name"] = manifest.Name
 		sidecarVars["sidecar"] = sidecarType
 
@@ -140,26 +155,22 @@ func RenderService(manifest *ServiceManifest, provisionsDir string) (*RenderOutp
 
 // mergeProvision merges a provision's outputs into the render output.
 func mergeProvision(output *RenderOutput, provision *Provision) {
-	if provision.Compose != nil {
-		output.Compose = DeepMerge(output.Compose, provision.Compose)
-	}
-	if provision.Traefik != nil {
-		output.Traefik = DeepMerge(output.Traefik, provision.Traefik)
-	}
-	if provision.Gatus != nil {
-		output.Gatus = DeepMerge(output.Gatus, provision.Gatus)
-	}
+	// mergeOwned ignores nil targets, so provisions that only set one target
+	// cost a single merge.
+	output.Compose = mergeOwned(output.Compose, provision.Compose)
+	output.Traefik = mergeOwned(output.Traefik, provision.Traefik)
+	output.Gatus = mergeOwned(output.Gatus, provision.Gatus)
 }
 
 // RenderStack renders a stack file into compose/traefik/gatus outputs.
 func RenderStack(stackPath, provisionsDir, servicesDir string, valuesOverlay map[string]any) (*RenderOutput, error) {
-	stackContent, err := os.ReadFile(stackPath)
+	stackContent, err := readFileCached(stackPath)
 	if err != nil {
 		return nil, fmt.Errorf("read stack file: %w", err)
 	}
 
-	// Validate apiVersion if present (soft validation for backwards compatibility)
-	meta, err := ValidateManifest(stackContent)
+	// Parse once and validate apiVersion if present (soft validation for backwards compatibility)
+	stackDoc, meta, err := parseManifest(stackContent)
 	if err != nil {
 		return nil, fmt.Errorf("validate stack: %w", err)
 	}
@@ -172,66 +183,93 @@ func RenderStack(stackPath, provisionsDir, servicesDir string, valuesOverlay map
 	}
 
 	var stack Stack
-	if err := yaml.Unmarshal(stackContent, &stack); err != nil {
+	if err := stackDoc.Decode(&stack); err != nil {
 		return nil, fmt.Errorf("parse stack file: %w", err)
 	}
 
-	output := NewRenderOutput()
+	// Services are independent until they are merged, so render them
+	// concurrently (bounded by GOMAXPROCS) and merge in include order to keep
+	// the output and the reported error deterministic.
+	results := make([]*RenderOutput, len(stack.Include))
+	errs := make([]error, len(stack.Include))
+	sem := make(chan struct{}, runtime.GOMAXPROCS(0))
+	var wg sync.WaitGroup
+	for i, serviceFile := range stack.Include {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func() {
+			defer wg.Done()
+			defer func() { <-sem }()
+			results[i], errs[i] = renderStackService(serviceFile, provisionsDir, servicesDir, valuesOverlay)
+		}()
+	}
+	wg.Wait()
 
-	for _, serviceFile := range stack.Include {
-		// Validate path to prevent path traversal attacks
-		servicePath, err := validatePathWithinDir(servicesDir, serviceFile)
-		if err != nil {
-			return nil, fmt.Errorf("validate service path %s: %w", serviceFile, err)
+	output := NewRenderOutput()
+	for i, serviceOutput := range results {
+		if errs[i] != nil {
+			return nil, errs[i]
 		}
 
-		serviceContent, err := os.ReadFile(servicePath)
-		if err != nil {
-			return nil, fmt.Errorf("read service %s: %w", serviceFile, err)
-		}
+		output.Compose = mergeOwned(output.Compose, serviceOutput.Compose)
+		output.Traefik = mergeOwned(output.Traefik, serviceOutput.Traefik)
+		output.Gatus = mergeOwned(output.Gatus, serviceOutput.Gatus)
+	}
 
-		// Validate apiVersion if present (soft validation for backwards compatibility)
-		serviceMeta, err := ValidateManifest(serviceContent)
-		if err != nil {
-			return nil, fmt.Errorf("validate service %s: %w", serviceFile, err)
-		}
+	// Add network definitions from stack
+	if stack.Networks != nil {
+		output.Compose["networks"] = stack.Networks
+	}
 
-		// Warn if manifest is unversioned
-		if serviceMeta.APIVersion == "" {
-			log.Printf("Warning: service %s is missing apiVersion field (run 'bosun migrate' to update)", serviceFile)
-		} else if serviceMeta.Kind != "" && serviceMeta.Kind != KindService {
-			log.Printf("Warning: service %s has kind %s, expected %s", serviceFile, serviceMeta.Kind, KindService)
-		}
+	return output, nil
+}
 
-		var manifest ServiceManifest
-		if err := yaml.Unmarshal(serviceContent, &manifest); err != nil {
-			return nil, fmt.Errorf("parse service %s: %w", serviceFile, err)
-		}
+// renderStackService loads one service included by a stack, applies the values
+// overlay to its config, and renders it. Safe to call concurrently.
+func renderStackService(serviceFile, provisionsDir, servicesDir string, valuesOverlay map[string]any) (*RenderOutput, error) {
+	// Validate path to prevent path traversal attacks
+	servicePath, err := validatePathWithinDir(servicesDir, serviceFile)
+	if err != nil {
+		return nil, fmt.Errorf("validate service path %s: %w", serviceFile, err)
+	}
 
-		// Apply values overlay to service config
-		if len(valuesOverlay) > 0 {
-			if manifest.Config == nil {
-				manifest.Config = make(map[string]any)
-			}
-			manifest.Config = DeepMerge(manifest.Config, valuesOverlay)
-		}
+	serviceContent, err := readFileCached(servicePath)
+	if err != nil {
+		return nil, fmt.Errorf("read service %s: %w", serviceFile, err)
+	}
 
-		serviceOutput, err := RenderService(&manifest, provisionsDir)
-		if err != nil {
-			return nil, fmt.Errorf("render service %s: %w", manifest.Name, err)
-		}
+	// Parse once and validate apiVersion if present (soft validation for backwards compatibility)
+	serviceDoc, serviceMeta, err := parseManifest(serviceContent)
+	if err != nil {
+		return nil, fmt.Errorf("validate service %s: %w", serviceFile, err)
+	}
 
-		output.Compose = DeepMerge(output.Compose, serviceOutput.Compose)
-		output.Traefik = DeepMerge(output.Traefik, serviceOutput.Traefik)
-		output.Gatus = DeepMerge(output.Gatus, serviceOutput.Gatus)
+	// Warn if manifest is unversioned
+	if serviceMeta.APIVersion == "" {
+		log.Printf("Warning: service %s is missing apiVersion field (run 'bosun migrate' to update)", serviceFile)
+	} else if serviceMeta.Kind != "" && serviceMeta.Kind != KindService {
+		log.Printf("Warning: service %s has kind %s, expected %s", serviceFile, serviceMeta.Kind, KindService)
 	}
 
-	// Add network definitions from stack
-	if stack.Networks != nil {
-		output.Compose["networks"] = stack.Networks
+	var manifest ServiceManifest
+	if err := serviceDoc.Decode(&manifest); err != nil {
+		return nil, fmt.Errorf("parse service %s: %w", serviceFile, err)
 	}
 
-	return output, nil
+	// Apply values overlay to service config (copied in, the overlay is shared)
+	if len(valuesOverlay) > 0 {
+		if manifest.Config == nil {
+			manifest.Config = make(map[string]any)
+		}
+		manifest.Config = deepMergeInto(manifest.Config, valuesOverlay)
+	}
+
+	serviceOutput, err := RenderService(&manifest, provisionsDir)
+	if err != nil {
+		return nil, fmt.Errorf("render service %s: %w", manifest.Name, err)
+	}
+
+	return serviceOutput, nil
 }
 
 // WriteOutputs writes rendered outputs to files in the output directory.
@@ -260,12 +298,7 @@ func WriteOutputs(output *RenderOutput, outputDir, stackName string) error {
 		}
 
 		outputPath := filepath.Join(targetDir, cfg.filename)
-		data, err := yaml.Marshal(cfg.content)
-		if err != nil {
-			return fmt.Errorf("marshal %s output: %w", target, err)
-		}
-
-		if err := os.WriteFile(outputPath, data, 0644); err != nil {
+		if err := writeYAMLFile(outputPath, cfg.content); err != nil {
 			return fmt.Errorf("write %s output: %w", target, err)
 		}
 
@@ -275,20 +308,55 @@ func WriteOutputs(output *RenderOutput, outputDir, stackName string) error {
 	return nil
 }
 
-// RenderToYAML renders an output to YAML string for dry-run display.
-func RenderToYAML(output *RenderOutput) (string, error) {
+// writeYAMLFile encodes content straight into the file at path instead of
+// marshaling the whole document into memory before writing it.
+func writeYAMLFile(path string, content map[string]any) (err error) {
+	f, err := os.OpenFile(path, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return err
+	}
+	defer func() {
+		if closeErr := f.Close(); err == nil {
+			err = closeErr
+		}
+	}()
+
+	return encodeYAML(f, content)
+}
+
+// encodeYAML streams value to w as a single YAML document through a buffered
+// writer. The output is identical to yaml.Marshal.
+func encodeYAML(w io.Writer, value any) error {
+	bw := bufio.NewWriter(w)
+	enc := yaml.NewEncoder(bw)
+	if err := enc.Encode(value); err != nil {
+		return fmt.Errorf("marshal output: %w", err)
+	}
+	if err := enc.Close(); err != nil {
+		return fmt.Errorf("marshal output: %w", err)
+	}
+	return bw.Flush()
+}
+
+// WriteYAML streams the combined output as YAML to w for dry-run display.
+func WriteYAML(w io.Writer, output *RenderOutput) error {
 	combined := map[string]any{
 		"compose": output.Compose,
 		"traefik": output.Traefik,
 		"gatus":   output.Gatus,
 	}
 
-	data, err := yaml.Marshal(combined)
-	if err != nil {
-		return "", fmt.Errorf("marshal output: %w", err)
+	return encodeYAML(w, combined)
+}
+
+// RenderToYAML renders an output to YAML string for dry-run display.
+func RenderToYAML(output *RenderOutput) (string, error) {
+	var sb strings.Builder
+	if err := WriteYAML(&sb, output); err != nil {
+		return "", err
 	}
 
-	return string(data), nil
+	return sb.String(), nil
 }
 
 // LoadServiceManifest loads a service manifest from a file.
@@ -298,8 +366,8 @@ func LoadServiceManifest(path string) (*ServiceManifest, error) {
 		return nil, fmt.Errorf("read manifest: %w", err)
 	}
 
-	// Validate apiVersion if present (soft validation for backwards compatibility)
-	meta, err := ValidateManifest(content)
+	// Parse once and validate apiVersion if present (soft validation for backwards compatibility)
+	doc, meta, err := parseManifest(content)
 	if err != nil {
 		return nil, fmt.Errorf("validate manifest: %w", err)
 	}
@@ -312,7 +380,7 @@ func LoadServiceManifest(path string) (*ServiceManifest, error) {
 	}
 
 	var manifest ServiceManifest
-	if err := yaml.Unmarshal(content, &manifest); err != nil {
+	if err := doc.Decode(&manifest); err != nil {
 		return nil, fmt.Errorf("parse manifest: %w", err)
 	}
 
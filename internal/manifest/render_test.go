@@ -4,6 +4,7 @@ import (
 	"flag"
 	"os"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
@@ -115,6 +116,31 @@ func TestRenderService_WithExplicitSidecars(t *testing.T) {
 	assert.True(t, hasRedisVolume)
 }
 
+func TestRenderService_SidecarOrderIsStable(t *testing.T) {
+	provisionsDir := filepath.Join("testdata", "provisions")
+
+	manifest := &ServiceManifest{
+		Name: "fullapp",
+		Services: map[string]map[string]any{
+			"redis":    {"version": "7"},
+			"postgres": {"version": "16", "db": "fullapp_prod"},
+		},
+		Config: map[string]any{
+			"db_password": "production_secret",
+		},
+	}
+
+	// Sidecars are merged by name, so union lists come out in the same order every time
+	for i := 0; i < 10; i++ {
+		output, err := RenderService(manifest, provisionsDir)
+		require.NoError(t, err)
+
+		services := output.Compose["services"].(map[string]any)
+		app := services["fullapp"].(map[string]any)
+		assert.Equal(t, []any{"fullapp-db", "fullapp-redis"}, app["depends_on"])
+	}
+}
+
 func TestRenderService_RawPassthrough(t *testing.T) {
 	manifest := &ServiceManifest{
 		Name: "rawservice",
@@ -218,6 +244,51 @@ func TestRenderStack(t *testing.T) {
 	assert.True(t, hasDefault)
 }
 
+func TestRenderStack_MultipleServices(t *testing.T) {
+	tmpDir := t.TempDir()
+	stackPath := filepath.Join(tmpDir, "stack.yml")
+	stackContent := `include:
+  - simple-service.yml
+  - needs-service.yml
+  - sidecar-service.yml
+  - webapp-service.yml
+`
+	require.NoError(t, os.WriteFile(stackPath, []byte(stackContent), 0644))
+
+	provisionsDir := filepath.Join("testdata", "provisions")
+	servicesDir := filepath.Join("testdata", "services")
+
+	output, err := RenderStack(stackPath, provisionsDir, servicesDir, nil)
+	require.NoError(t, err)
+
+	// Services render concurrently but every one lands in the merged output
+	services, ok := output.Compose["services"].(map[string]any)
+	require.True(t, ok)
+	for _, name := range []string{"myapp", "dbapp", "dbapp-db", "fullapp", "fullapp-db", "fullapp-redis", "mywebapp"} {
+		assert.Contains(t, services, name)
+	}
+	assert.NotEmpty(t, output.Traefik)
+	assert.NotEmpty(t, output.Gatus)
+}
+
+func TestRenderStack_FirstErrorInIncludeOrder(t *testing.T) {
+	tmpDir := t.TempDir()
+	stackPath := filepath.Join(tmpDir, "stack.yml")
+	stackContent := `include:
+  - simple-service.yml
+  - missing-one.yml
+  - missing-two.yml
+`
+	require.NoError(t, os.WriteFile(stackPath, []byte(stackContent), 0644))
+
+	provisionsDir := filepath.Join("testdata", "provisions")
+	servicesDir := filepath.Join("testdata", "services")
+
+	_, err := RenderStack(stackPath, provisionsDir, servicesDir, nil)
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "read service missing-one.yml")
+}
+
 func TestRenderStack_WithValuesOverlay(t *testing.T) {
 	stackPath := filepath.Join("testdata", "stacks", "test-stack.yml")
 	provisionsDir := filepath.Join("testdata", "provisions")
@@ -261,6 +332,33 @@ func TestRenderToYAML(t *testing.T) {
 	assert.Contains(t, yamlStr, "test:latest")
 }
 
+func TestWriteYAML_MatchesMarshal(t *testing.T) {
+	output := &RenderOutput{
+		Compose: map[string]any{
+			"services": map[string]any{
+				"test": map[string]any{
+					"image":    "test:latest",
+					"networks": []any{"proxynet"},
+				},
+			},
+		},
+		Traefik: map[string]any{},
+		Gatus:   map[string]any{},
+	}
+
+	var buf strings.Builder
+	require.NoError(t, WriteYAML(&buf, output))
+
+	// Streaming must produce exactly what yaml.Marshal did
+	want, err := yaml.Marshal(map[string]any{
+		"compose": output.Compose,
+		"traefik": output.Traefik,
+		"gatus":   output.Gatus,
+	})
+	require.NoError(t, err)
+	assert.Equal(t, string(want), buf.String())
+}
+
 func TestGoldenFile_SimpleService(t *testing.T) {
 	goldenPath := filepath.Join("testdata", "golden", "compose", "simple-service.yml")
 	provisionsDir := filepath.Join("testdata", "provisions")
@@ -91,6 +91,27 @@ func ValidateManifest(data []byte) (*ManifestMeta, error) {
 	return &meta, nil
 }
 
+// parseManifest parses raw YAML once and validates its apiVersion, returning the
+// document node so callers can decode the body without scanning the text again.
+// Errors match ValidateManifest so callers can keep their existing wrapping.
+func parseManifest(data []byte) (*yaml.Node, *ManifestMeta, error) {
+	var doc yaml.Node
+	if err := yaml.Unmarshal(data, &doc); err != nil {
+		return nil, nil, fmt.Errorf("parse manifest metadata: %w", err)
+	}
+
+	var meta ManifestMeta
+	if err := doc.Decode(&meta); err != nil {
+		return nil, nil, fmt.Errorf("parse manifest metadata: %w", err)
+	}
+
+	if err := ValidateAPIVersion(meta.APIVersion); err != nil {
+		return &doc, &meta, err
+	}
+
+	return &doc, &meta, nil
+}
+
 // ValidateManifestStrict validates a manifest and requires apiVersion and kind fields.
 // Use this for strict validation where missing fields should be errors.
 func ValidateManifestStrict(data []byte, expectedKind string) (*ManifestMeta, error) {
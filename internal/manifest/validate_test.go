@@ -296,3 +296,26 @@ kind: Stack`,
 		})
 	}
 }
+
+func TestParseManifest(t *testing.T) {
+	data := `apiVersion: bosun.io/v1
+kind: Stack
+include:
+  - app.yml
+`
+	doc, meta, err := parseManifest([]byte(data))
+	require.NoError(t, err)
+	assert.Equal(t, APIVersionV1, meta.APIVersion)
+	assert.Equal(t, KindStack, meta.Kind)
+
+	// The returned node decodes the body without re-parsing the text
+	var stack Stack
+	require.NoError(t, doc.Decode(&stack))
+	assert.Equal(t, []string{"app.yml"}, stack.Include)
+
+	_, _, err = parseManifest([]byte(`apiVersion: invalid/v999`))
+	assert.ErrorIs(t, err, ErrUnsupportedAPIVersion)
+
+	_, _, err = parseManifest([]byte(`invalid: yaml: [`))
+	assert.Error(t, err)
+}